@@ -2,7 +2,8 @@
 # pylint: disable=missing-module-docstring,missing-class-docstring,protected-access
 # pylint: disable=attribute-defined-outside-init,invalid-name
 # type: ignore
-from typing import Any, Callable, Dict, Generator, List, Optional, Tuple
+import contextlib
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple
 
 import pytest
 from google.auth import credentials
@@ -11,6 +12,12 @@ from google.cloud.spanner_v1 import database, table, transaction
 
 from py_spanner_mutex.gcp import spanner as gcp_spanner
 
+_CLIENT_NAME: str = gcp_spanner._client.__name__
+_SPANNER_CLIENT_NAME: str = gcp_spanner._spanner_client.__name__
+_EMULATOR_CLIENT_NAME: str = gcp_spanner._emulator_client.__name__
+_SPANNER_INSTANCE_NAME: str = gcp_spanner._spanner_instance.__name__
+_DEFAULT_CREDS_NAME: str = gcp_spanner._default_credentials_project.__name__
+
 
 class _CloudCredentials(credentials.Credentials):
     def refresh(self, request):
@@ -18,46 +25,44 @@ class _CloudCredentials(credentials.Credentials):
 
 
 _TEST_PROJECT_ID: str = "TEST_PROJECT"
+_TEST_PROJECT_ID_LOCAL: str = _TEST_PROJECT_ID + "_LOCAL"
 _TEST_CREDS: credentials.Credentials = _CloudCredentials()
+_TEST_CREDS_LOCAL: credentials.Credentials = _CloudCredentials()
 
 
-def test__emulator_client_ok_without_args():
-    # Given/When
-    obj = gcp_spanner._emulator_client()
-    # Then
-    assert isinstance(obj, spanner.Client)
-    assert obj.project_name.endswith(gcp_spanner._SPANNER_EMULATOR_PROJECT_NAME)
-    assert isinstance(obj.credentials, credentials.AnonymousCredentials)
-
-
-def test__emulator_client_ok_with_args():
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        pytest.param({}, id="without_args"),
+        pytest.param({"project_id": _TEST_PROJECT_ID, "creds": _TEST_CREDS}, id="with_args"),
+    ],
+)
+def test__emulator_client_ok(kwargs: Dict[str, Any]):
     # Given/When
-    obj = gcp_spanner._emulator_client(project_id=_TEST_PROJECT_ID, creds=_TEST_CREDS)
+    obj = gcp_spanner._emulator_client(**kwargs)
     # Then
     assert isinstance(obj, spanner.Client)
     # Then: ignores project argument
     assert obj.project_name.endswith(gcp_spanner._SPANNER_EMULATOR_PROJECT_NAME)
-    assert obj.project_name != _TEST_PROJECT_ID
     # Then: ignores credentials argument
-    assert obj.credentials != _TEST_CREDS
     assert isinstance(obj.credentials, credentials.AnonymousCredentials)
 
 
-@pytest.fixture
-def default_credentials_project(
-    project_id: str = _TEST_PROJECT_ID, creds: credentials.Credentials = _TEST_CREDS
-) -> Callable[[], Tuple[credentials.Credentials, str]]:
-    def default_credentials_project_mock() -> Tuple[credentials.Credentials, str]:
-        return creds, project_id
+def _default_credentials_project_mock() -> Tuple[credentials.Credentials, str]:
+    return _TEST_CREDS, _TEST_PROJECT_ID
 
-    return default_credentials_project_mock
+
+@pytest.fixture
+def default_credentials_project(monkeypatch) -> Callable[[], Tuple[credentials.Credentials, str]]:
+    monkeypatch.setattr(gcp_spanner, _DEFAULT_CREDS_NAME, _default_credentials_project_mock)
+    return _default_credentials_project_mock
 
 
-def test__spanner_client_ok_with_args(monkeypatch, default_credentials_project):
+@pytest.mark.usefixtures("default_credentials_project")
+def test__spanner_client_ok_with_args():
     # Given
-    project_id = _TEST_PROJECT_ID + "_LOCAL"
-    creds = _CloudCredentials()
-    monkeypatch.setattr(gcp_spanner, gcp_spanner._default_credentials_project.__name__, default_credentials_project)
+    project_id = _TEST_PROJECT_ID_LOCAL
+    creds = _TEST_CREDS_LOCAL
     # When
     result = gcp_spanner._spanner_client(project_id=project_id, creds=creds)
     # Then
@@ -66,10 +71,9 @@ def test__spanner_client_ok_with_args(monkeypatch, default_credentials_project):
     assert result.credentials == creds
 
 
-def test__spanner_client_ok_without_args(monkeypatch, default_credentials_project):
-    # Given
-    monkeypatch.setattr(gcp_spanner, gcp_spanner._default_credentials_project.__name__, default_credentials_project)
-    # When
+@pytest.mark.usefixtures("default_credentials_project")
+def test__spanner_client_ok_without_args():
+    # Given/When
     result = gcp_spanner._spanner_client()
     # Then
     assert isinstance(result, spanner.Client)
@@ -77,50 +81,38 @@ def test__spanner_client_ok_without_args(monkeypatch, default_credentials_projec
     assert result.credentials == _TEST_CREDS
 
 
-def test__client_ok_with_args_emulator(monkeypatch, default_credentials_project):
-    # Given
-    project_id = _TEST_PROJECT_ID + "_LOCAL"
-    creds = _CloudCredentials()
-    monkeypatch.setattr(gcp_spanner, gcp_spanner._default_credentials_project.__name__, default_credentials_project)
-    monkeypatch.setenv(gcp_spanner.SPANNER_USE_EMULATOR_ENV_VAR, gcp_spanner.SPANNER_USE_EMULATOR_ENV_VAR_VALUE)
-    # When
-    result = gcp_spanner._client(project_id=project_id, creds=creds)
-    # Then
-    assert isinstance(result, spanner.Client)
-    # Then: ignore arguments, it is for emulator
-    assert result.credentials != creds
-    assert not result.project_name.endswith(project_id)
+@pytest.fixture(params=[True, False], ids=["emulator", "not_emulator"])
+def use_emulator_env(monkeypatch, request) -> bool:
+    env_var_value = gcp_spanner.SPANNER_USE_EMULATOR_ENV_VAR_VALUE if request.param else "NOT"
+    monkeypatch.setenv(gcp_spanner.SPANNER_USE_EMULATOR_ENV_VAR, env_var_value)
+    return request.param
 
 
-def test__client_ok_with_args_not_emulator(monkeypatch, default_credentials_project):
+@pytest.mark.usefixtures("default_credentials_project")
+def test__client_ok_with_args(use_emulator_env: bool):
     # Given
-    project_id = _TEST_PROJECT_ID + "_LOCAL"
-    creds = _CloudCredentials()
-    monkeypatch.setattr(gcp_spanner, gcp_spanner._default_credentials_project.__name__, default_credentials_project)
-    monkeypatch.setenv(
-        gcp_spanner.SPANNER_USE_EMULATOR_ENV_VAR, gcp_spanner.SPANNER_USE_EMULATOR_ENV_VAR_VALUE + "_NOT"
-    )
+    project_id = _TEST_PROJECT_ID_LOCAL
+    creds = _TEST_CREDS_LOCAL
     # When
     result = gcp_spanner._client(project_id=project_id, creds=creds)
     # Then
     assert isinstance(result, spanner.Client)
-    # Then: ignore arguments, it is for emulator
-    assert result.credentials == creds
-    assert result.project_name.endswith(project_id)
+    # Then: emulator ignores arguments
+    assert (result.credentials != creds) == use_emulator_env
+    assert result.project_name.endswith(project_id) != use_emulator_env
 
 
-@pytest.mark.parametrize("use_emulator", [True, False])
-def test__client_nok_raise(monkeypatch, use_emulator: bool):
-    # Given
-    def client_mock(*args, **kwargs) -> Any:
-        raise RuntimeError
+def _raising_client_mock(*args, **kwargs) -> Any:
+    raise RuntimeError
 
-    monkeypatch.setattr(gcp_spanner, gcp_spanner._emulator_client.__name__, client_mock)
-    monkeypatch.setattr(gcp_spanner, gcp_spanner._spanner_client.__name__, client_mock)
-    env_var_value = gcp_spanner.SPANNER_USE_EMULATOR_ENV_VAR_VALUE if use_emulator else "NOT"
-    monkeypatch.setenv(gcp_spanner.SPANNER_USE_EMULATOR_ENV_VAR, env_var_value)
+
+@pytest.mark.usefixtures("use_emulator_env")
+def test__client_nok_raise(monkeypatch):
+    # Given
+    monkeypatch.setattr(gcp_spanner, _EMULATOR_CLIENT_NAME, _raising_client_mock)
+    monkeypatch.setattr(gcp_spanner, _SPANNER_CLIENT_NAME, _raising_client_mock)
     # When/Then
-    with pytest.raises(gcp_spanner.SpannerError):
+    with pytest.raises(gcp_spanner.SpannerError, match="Could not create client"):
         gcp_spanner._client()
 
 
@@ -150,9 +142,7 @@ class _TableStub(table.Table):
             raise RuntimeError
         self._exists = exists
         col_names = col_names if col_names is not None else _TEST_TABLE_COLUMN_NAMES
-        self._schema = []
-        for col in col_names:
-            self.schema.append(_FieldStub(col))
+        self._schema = [_FieldStub(col) for col in col_names]
 
     def exists(self) -> bool:
         return self._exists
@@ -160,15 +150,10 @@ class _TableStub(table.Table):
 
 class _SnapshotStub:
     def __init__(self, values: List[List[Any]]):
-        self._values = values
-        self.calls = {}
+        self._values = tuple(tuple(vals) for vals in values)
 
-    def read(self, table, columns, keyset, **kwargs) -> Generator[List[Any], None, None]:
-        if _SnapshotStub.read.__name__ not in self.calls:
-            self.calls[_SnapshotStub.read.__name__] = []
-        self.calls[_SnapshotStub.read.__name__].append(locals())
-        for vals in self._values:
-            yield vals
+    def read(self, table, columns, keyset, **kwargs) -> Iterator[Tuple[Any, ...]]:
+        return iter(self._values)
 
 
 class _SnapshotCtxMngr:
@@ -191,19 +176,28 @@ class _TransactionStub(transaction.Transaction):
     def __init__(self, read_result: Optional[List[Any]] = None):
         super(_TransactionStub, self).__init__(_SessionStub())
         self._read_results = read_result if read_result else []
-        self.called_upsert = []
-        self.called_read = []
+        self.upsert_count = 0
+        self.last_upsert: Optional[Dict[str, Any]] = None
+        self.read_count = 0
+        self.last_read: Optional[Dict[str, Any]] = None
 
     def insert_or_update(self, table, columns, values):
-        self.called_upsert.append(locals())
+        self.upsert_count += 1
+        self.last_upsert = {"table": table, "columns": columns, "values": values}
 
     def read(self, table: str, columns: List[str], keyset: spanner.KeySet) -> Any:
-        self.called_read.append(locals())
+        self.read_count += 1
+        self.last_read = {
+            "table": table,
+            "columns": columns,
+            "keys": frozenset(tuple(key) for key in keyset.keys),
+        }
         return iter(self._read_results)
 
 
 class _DatabaseStub(database.Database):
-    def __init__(
+    # only subclassing to pass the isinstance() checks, the parent constructor builds a session pool
+    def __init__(  # pylint: disable=super-init-not-called
         self,
         *,
         instance: Any,
@@ -218,7 +212,7 @@ class _DatabaseStub(database.Database):
     ):
         if to_raise:
             raise RuntimeError
-        super().__init__(database_id=database_id, instance=instance)
+        self._instance = instance
         self.instance = instance
         self.database_id = database_id
         self._exists = exists
@@ -227,7 +221,7 @@ class _DatabaseStub(database.Database):
         self._table_to_raise = table_to_raise
         self._snapshot_values = snapshot_values if snapshot_values else []
         self._table_columns = table_columns
-        self.called_run_in_txn = []
+        self.run_in_txn_count = 0
 
     def exists(self) -> bool:
         return self._exists
@@ -252,11 +246,13 @@ class _DatabaseStub(database.Database):
 
     def run_in_transaction(self, func: Callable, *args, **kw):
         txn = _TransactionStub()
-        self.called_run_in_txn.append(locals())
+        self.run_in_txn_count += 1
         return func(txn, *args, **kw)
 
 
 class _InstanceStub:
+    __slots__ = ("_client", "name", "_exists", "_database_exists", "_database_is_ready", "_database_to_raise")
+
     def __init__(
         self,
         *,
@@ -291,6 +287,18 @@ class _InstanceStub:
 
 
 class _ClientStub:
+    __slots__ = (
+        "project",
+        "credentials",
+        "project_name",
+        "_instance_exists",
+        "_instance_to_raise",
+        "_database_exists",
+        "_database_is_ready",
+        "_database_to_raise",
+        "route_to_leader_enabled",
+    )
+
     def __init__(
         self,
         *,
@@ -325,244 +333,133 @@ class _ClientStub:
         )
 
 
-def test__spanner_instance_ok_with_args(monkeypatch):
-    # Given
-    project_id_arg = _TEST_PROJECT_ID + "_LOCAL"
-    creds_arg = _CloudCredentials()
-    instance_id = _TEST_INSTANCE_ID
-    client = _ClientStub(project_id=project_id_arg, creds=creds_arg)
-
-    def client_mock(*, project_id: Optional[str] = None, creds: Optional[credentials.Credentials] = None) -> Any:
-        assert project_id == project_id_arg
-        assert creds == creds_arg
-        return client
-
-    monkeypatch.setattr(gcp_spanner, gcp_spanner._client.__name__, client_mock)
-    # When
-    result = gcp_spanner._spanner_instance(instance_id=instance_id, project_id=project_id_arg, creds=creds_arg)
-    # Then
-    assert result is not None
-
-
-def test__spanner_instance_nok_instance_raises(monkeypatch):
-    # Given
-    project_id_arg = _TEST_PROJECT_ID + "_LOCAL"
-    creds_arg = _CloudCredentials()
-    instance_id = _TEST_INSTANCE_ID
-    client = _ClientStub(project_id=project_id_arg, creds=creds_arg, instance_to_raise=True)
+@pytest.fixture(scope="session")
+def client_stub() -> _ClientStub:
+    return _ClientStub(project_id=_TEST_PROJECT_ID, creds=_TEST_CREDS)
 
-    def client_mock(*, project_id: Optional[str] = None, creds: Optional[credentials.Credentials] = None) -> Any:
-        assert project_id == project_id_arg
-        assert creds == creds_arg
-        return client
 
-    monkeypatch.setattr(gcp_spanner, gcp_spanner._client.__name__, client_mock)
-    # When/Then
-    with pytest.raises(gcp_spanner.SpannerError):
-        gcp_spanner._spanner_instance(instance_id=instance_id, project_id=project_id_arg, creds=creds_arg)
+@pytest.fixture(scope="session")
+def instance_stub(client_stub: _ClientStub) -> _InstanceStub:
+    return _InstanceStub(client=client_stub, instance_id=_TEST_INSTANCE_ID)
 
 
-def test__spanner_instance_nok_instance_does_not_exist(monkeypatch):
+@pytest.fixture
+def patched_client(monkeypatch) -> Callable[..., None]:
+    def patch(client: Any, **expected_kwargs) -> None:
+        def client_mock(**kwargs) -> Any:
+            assert kwargs == expected_kwargs
+            return client
+
+        monkeypatch.setattr(gcp_spanner, _CLIENT_NAME, client_mock)
+
+    return patch
+
+
+@pytest.mark.parametrize(
+    "client_kwargs,expected_error",
+    [
+        pytest.param({}, None, id="ok"),
+        pytest.param({"instance_to_raise": True}, "Could not get Spanner instance", id="nok_instance_raises"),
+        pytest.param({"instance_exists": False}, "does not exist", id="nok_instance_does_not_exist"),
+    ],
+)
+def test__spanner_instance(patched_client, client_kwargs: Dict[str, Any], expected_error: Optional[str]):
     # Given
-    project_id_arg = _TEST_PROJECT_ID + "_LOCAL"
-    creds_arg = _CloudCredentials()
+    project_id_arg = _TEST_PROJECT_ID_LOCAL
+    creds_arg = _TEST_CREDS_LOCAL
     instance_id = _TEST_INSTANCE_ID
-    client = _ClientStub(project_id=project_id_arg, creds=creds_arg, instance_exists=False)
-
-    def client_mock(*, project_id: Optional[str] = None, creds: Optional[credentials.Credentials] = None) -> Any:
-        assert project_id == project_id_arg
-        assert creds == creds_arg
-        return client
-
-    monkeypatch.setattr(gcp_spanner, gcp_spanner._client.__name__, client_mock)
-    # When/Then
-    with pytest.raises(gcp_spanner.SpannerError):
-        gcp_spanner._spanner_instance(instance_id=instance_id, project_id=project_id_arg, creds=creds_arg)
-
-
-def test_spanner_db_ok(monkeypatch):
-    # Given
-    project_id_arg = _TEST_PROJECT_ID
-    creds_arg = _CloudCredentials()
-    instance_id_arg = _TEST_INSTANCE_ID
-    database_id = _TEST_DATABASE_ID
-    spanner_instance = _InstanceStub(
-        client=_ClientStub(project_id=project_id_arg, creds=creds_arg), instance_id=instance_id_arg
-    )
-
-    def spanner_instance_mock(
-        *,
-        instance_id: str,
-        project_id: Optional[str] = None,
-        creds: Optional[credentials.Credentials] = None,
-    ) -> Any:
-        assert project_id == project_id_arg
-        assert creds == creds_arg
-        assert instance_id == instance_id_arg
-        return spanner_instance
-
-    monkeypatch.setattr(gcp_spanner, gcp_spanner._spanner_instance.__name__, spanner_instance_mock)
-    # When
-    result = gcp_spanner.spanner_db(
-        instance_id=instance_id_arg, database_id=database_id, project_id=project_id_arg, creds=creds_arg
-    )
-    # Then
-    assert result is not None
-    assert _TEST_PROJECT_ID in result.name
-    assert _TEST_INSTANCE_ID in result.name
-    assert _TEST_DATABASE_ID in result.name
-
-
-def test_spanner_db_nok_database_raises(monkeypatch):
-    # Given
-    project_id_arg = _TEST_PROJECT_ID
-    creds_arg = _CloudCredentials()
-    instance_id_arg = _TEST_INSTANCE_ID
-    database_id = _TEST_DATABASE_ID
-    spanner_instance = _InstanceStub(
-        client=_ClientStub(project_id=project_id_arg, creds=creds_arg),
-        instance_id=instance_id_arg,
-        database_to_raise=True,
-    )
-
-    def spanner_instance_mock(
-        *,
-        instance_id: str,
-        project_id: Optional[str] = None,
-        creds: Optional[credentials.Credentials] = None,
-    ) -> Any:
-        assert project_id == project_id_arg
-        assert creds == creds_arg
-        assert instance_id == instance_id_arg
-        return spanner_instance
-
-    monkeypatch.setattr(gcp_spanner, gcp_spanner._spanner_instance.__name__, spanner_instance_mock)
-    # When/Then
-    with pytest.raises(gcp_spanner.SpannerError):
-        gcp_spanner.spanner_db(
-            instance_id=instance_id_arg, database_id=database_id, project_id=project_id_arg, creds=creds_arg
-        )
-
-
-def test_spanner_db_nok_database_does_not_exist(monkeypatch):
-    # Given
-    project_id_arg = _TEST_PROJECT_ID
-    creds_arg = _CloudCredentials()
-    instance_id_arg = _TEST_INSTANCE_ID
-    database_id = _TEST_DATABASE_ID
-    spanner_instance = _InstanceStub(
-        client=_ClientStub(project_id=project_id_arg, creds=creds_arg),
-        instance_id=instance_id_arg,
-        database_exists=False,
-    )
-
-    def spanner_instance_mock(
-        *,
-        instance_id: str,
-        project_id: Optional[str] = None,
-        creds: Optional[credentials.Credentials] = None,
-    ) -> Any:
-        assert project_id == project_id_arg
-        assert creds == creds_arg
-        assert instance_id == instance_id_arg
-        return spanner_instance
-
-    monkeypatch.setattr(gcp_spanner, gcp_spanner._spanner_instance.__name__, spanner_instance_mock)
+    client = _ClientStub(project_id=project_id_arg, creds=creds_arg, **client_kwargs)
+    patched_client(client, project_id=project_id_arg, creds=creds_arg)
     # When/Then
-    with pytest.raises(gcp_spanner.SpannerError):
-        gcp_spanner.spanner_db(
-            instance_id=instance_id_arg, database_id=database_id, project_id=project_id_arg, creds=creds_arg
-        )
+    with pytest.raises(gcp_spanner.SpannerError, match=expected_error) if expected_error else contextlib.nullcontext():
+        result = gcp_spanner._spanner_instance(instance_id=instance_id, project_id=project_id_arg, creds=creds_arg)
+        # Then
+        assert result is not None
 
 
-def test_spanner_db_nok_database_is_not_ready(monkeypatch):
+@pytest.fixture
+def patched_spanner_instance(monkeypatch) -> Callable[..., None]:
+    def patch(spanner_instance: Any, **expected_kwargs) -> None:
+        def spanner_instance_mock(**kwargs) -> Any:
+            assert kwargs == expected_kwargs
+            return spanner_instance
+
+        monkeypatch.setattr(gcp_spanner, _SPANNER_INSTANCE_NAME, spanner_instance_mock)
+
+    return patch
+
+
+@pytest.mark.parametrize(
+    "instance_kwargs,expected_error",
+    [
+        pytest.param({}, None, id="ok"),
+        pytest.param({"database_to_raise": True}, "Could not get database", id="nok_database_raises"),
+        pytest.param({"database_exists": False}, "does not exist", id="nok_database_does_not_exist"),
+        pytest.param({"database_is_ready": False}, "is not ready", id="nok_database_is_not_ready"),
+    ],
+)
+def test_spanner_db(
+    patched_spanner_instance, client_stub, instance_kwargs: Dict[str, Any], expected_error: Optional[str]
+):
     # Given
     project_id_arg = _TEST_PROJECT_ID
-    creds_arg = _CloudCredentials()
+    creds_arg = _TEST_CREDS
     instance_id_arg = _TEST_INSTANCE_ID
     database_id = _TEST_DATABASE_ID
-    spanner_instance = _InstanceStub(
-        client=_ClientStub(project_id=project_id_arg, creds=creds_arg),
-        instance_id=instance_id_arg,
-        database_is_ready=False,
-    )
-
-    def spanner_instance_mock(
-        *,
-        instance_id: str,
-        project_id: Optional[str] = None,
-        creds: Optional[credentials.Credentials] = None,
-    ) -> Any:
-        assert project_id == project_id_arg
-        assert creds == creds_arg
-        assert instance_id == instance_id_arg
-        return spanner_instance
-
-    monkeypatch.setattr(gcp_spanner, gcp_spanner._spanner_instance.__name__, spanner_instance_mock)
+    spanner_instance = _InstanceStub(client=client_stub, instance_id=instance_id_arg, **instance_kwargs)
+    patched_spanner_instance(spanner_instance, instance_id=instance_id_arg, project_id=project_id_arg, creds=creds_arg)
     # When/Then
-    with pytest.raises(gcp_spanner.SpannerError):
-        gcp_spanner.spanner_db(
+    with pytest.raises(gcp_spanner.SpannerError, match=expected_error) if expected_error else contextlib.nullcontext():
+        result = gcp_spanner.spanner_db(
             instance_id=instance_id_arg, database_id=database_id, project_id=project_id_arg, creds=creds_arg
         )
+        # Then
+        assert result is not None
+        assert _TEST_PROJECT_ID in result.name
+        assert _TEST_INSTANCE_ID in result.name
+        assert _TEST_DATABASE_ID in result.name
 
 
-def test_spanner_table_ok():
-    # Given
-    db = _create_db()
-    table_id = _TEST_TABLE_ID
-    # When
-    result = gcp_spanner.spanner_table(db=db, table_id=table_id)
-    # Then
-    assert result is not None
-    assert result.table_id == table_id
-
-
-def _create_db(**db_kwargs):
-    if "database_id" not in db_kwargs:
-        db_kwargs["database_id"] = _TEST_DATABASE_ID
-    if "instance" not in db_kwargs:
-        client = _ClientStub(project_id=_TEST_PROJECT_ID, creds=_TEST_CREDS)
-        instance = _InstanceStub(client=client, instance_id=_TEST_INSTANCE_ID)
-        db_kwargs["instance"] = instance
-    return _DatabaseStub(**db_kwargs)
-
-
-def test_spanner_table_ok_table_does_not_exist():
-    # Given
-    db = _create_db(table_exists=False)
-    table_id = _TEST_TABLE_ID
-    # When
-    result = gcp_spanner.spanner_table(db=db, table_id=table_id, must_exist=False)
-    # Then
-    assert result is not None
-
-
-def test_spanner_table_nok_table_raise():
-    # Given
-    db = _create_db(table_to_raise=True)
-    table_id = _TEST_TABLE_ID
-    # When/Then
-    with pytest.raises(gcp_spanner.SpannerError):
-        gcp_spanner.spanner_table(db=db, table_id=table_id)
-
-
-def test_spanner_table_nok_table_does_not_exist():
+@pytest.fixture
+def create_db(instance_stub: _InstanceStub) -> Callable[..., _DatabaseStub]:
+    def create(**db_kwargs) -> _DatabaseStub:
+        db_kwargs.setdefault("database_id", _TEST_DATABASE_ID)
+        db_kwargs.setdefault("instance", instance_stub)
+        return _DatabaseStub(**db_kwargs)
+
+    return create
+
+
+@pytest.mark.parametrize(
+    "db_kwargs,must_exist,expected_error",
+    [
+        pytest.param({}, True, None, id="ok"),
+        pytest.param({"table_exists": False}, False, None, id="ok_table_does_not_exist"),
+        pytest.param({"table_to_raise": True}, True, "Could not retrieve table", id="nok_table_raise"),
+        pytest.param({"table_exists": False}, True, "must exist", id="nok_table_does_not_exist"),
+    ],
+)
+def test_spanner_table(create_db, db_kwargs: Dict[str, Any], must_exist: bool, expected_error: Optional[str]):
     # Given
-    db = _create_db(table_exists=False)
+    db = create_db(**db_kwargs)
     table_id = _TEST_TABLE_ID
     # When/Then
-    with pytest.raises(gcp_spanner.SpannerError):
-        gcp_spanner.spanner_table(db=db, table_id=table_id, must_exist=True)
+    with pytest.raises(gcp_spanner.SpannerError, match=expected_error) if expected_error else contextlib.nullcontext():
+        result = gcp_spanner.spanner_table(db=db, table_id=table_id, must_exist=must_exist)
+        # Then
+        assert result is not None
+        assert result.table_id == table_id
 
 
 _TEST_KEY: str = "TEST_KEY"
+_TEST_KEYS: FrozenSet[str] = frozenset((f"{_TEST_KEY}_A", f"{_TEST_KEY}_B", f"{_TEST_KEY}_C"))
 
 
-def test_read_table_rows_ok_without_results():
+def test_read_table_rows_ok_without_results(create_db):
     # Given
-    db = _create_db()
+    db = create_db()
     table_id = _TEST_TABLE_ID
-    keys = {f"{_TEST_KEY}_A", f"{_TEST_KEY}_B", f"{_TEST_KEY}_C"}
+    keys = set(_TEST_KEYS)
     # When
     result = []
     for r in gcp_spanner.read_table_rows(db=db, table_id=table_id, keys=keys):
@@ -571,7 +468,7 @@ def test_read_table_rows_ok_without_results():
     assert not result
 
 
-def test_read_table_rows_ok_with_results():
+def test_read_table_rows_ok_with_results(create_db):
     # Given
     columns = ["id", "col_str", "col_int"]
     values = [
@@ -579,47 +476,40 @@ def test_read_table_rows_ok_with_results():
         [f"{_TEST_KEY}_B", "value_b", 200],
         [f"{_TEST_KEY}_C", "value_c", 300],
     ]
-    values_dict = {val[0]: val[1:] for val in values}
-    db = _create_db(table_columns=columns, snapshot_values=values)
+    db = create_db(table_columns=columns, snapshot_values=values)
     table_id = _TEST_TABLE_ID
-    keys = {val[0] for val in values}
+    keys = set(_TEST_KEYS)
     # When
     result = []
     for r in gcp_spanner.read_table_rows(db=db, table_id=table_id, keys=keys):
         result.append(r)
     # Then
-    assert len(result) == len(values)
-    for r in result:
-        id = r.get("id")
-        exp_vals = values_dict.get(id)
-        assert exp_vals
-        for ndx in range(1, len(columns)):
-            assert r.get(columns[ndx]) == exp_vals[ndx - 1]
+    assert sorted([r[col] for col in columns] for r in result) == sorted(values)
 
 
-def test_conditional_upsert_table_row_ok_without_can_upsert():
+def test_conditional_upsert_table_row_ok_without_can_upsert(create_db):
     # Given
     row = {"id": _TEST_KEY, "col_str": "str_value", "col_int": 123}
-    db = _create_db()
+    db = create_db()
     table_id = _TEST_TABLE_ID
     # When
     assert gcp_spanner.conditional_upsert_table_row(db=db, table_id=table_id, row=row)
     # Then
-    assert len(db.called_run_in_txn) == 1
+    assert db.run_in_txn_count == 1
 
 
 @pytest.mark.parametrize("can_upsert_result", [True, False])
-def test_conditional_upsert_table_row_ok_with_can_upsert(can_upsert_result: bool):
+def test_conditional_upsert_table_row_ok_with_can_upsert(create_db, can_upsert_result: bool):
     # Given
     row_arg = {"id": _TEST_KEY, "col_str": "str_value", "col_int": 123}
-    db = _create_db()
+    db = create_db()
     table_id = _TEST_TABLE_ID
-    called = None
+    called_txn = None
 
     def can_upsert(txn: transaction.Transaction, tbl: table.Table, row: Dict[str, Any]) -> bool:
-        nonlocal called
-        called = locals()
-        assert not txn.called_upsert
+        nonlocal called_txn
+        called_txn = txn
+        assert not txn.upsert_count
         assert tbl.table_id == table_id
         assert row == row_arg
         return can_upsert_result
@@ -630,16 +520,17 @@ def test_conditional_upsert_table_row_ok_with_can_upsert(can_upsert_result: bool
         == can_upsert_result
     )
     # Then
-    assert called is not None
-    called_txn = called.get("txn")
     assert called_txn is not None
+    assert called_txn.upsert_count == (1 if can_upsert_result else 0)
     if can_upsert_result:
-        assert len(called_txn.called_upsert) == 1
+        assert called_txn.last_upsert["table"] == table_id
+        assert called_txn.last_upsert["columns"] == list(row_arg.keys())
+        assert called_txn.last_upsert["values"] == [list(row_arg.values())]
     else:
-        assert len(called_txn.called_upsert) == 0
+        assert called_txn.last_upsert is None
 
 
-def test_read_in_transaction_ok():
+def test_read_in_transaction_ok(create_db):
     columns = ["id", "col_str", "col_int"]
     values = [
         [f"{_TEST_KEY}_A", "value_a", 100],
@@ -647,8 +538,8 @@ def test_read_in_transaction_ok():
         [f"{_TEST_KEY}_C", "value_c", 300],
     ]
     txn = _TransactionStub(read_result=values)
-    tbl = _TableStub(table_id=_TEST_TABLE_ID, db=_create_db(), col_names=columns)
-    keys = set([(el[0],) for el in values])
+    tbl = _TableStub(table_id=_TEST_TABLE_ID, db=create_db(), col_names=columns)
+    keys = {(el[0],) for el in values}
     # When
     result = []
     for row in gcp_spanner.read_in_transaction(txn=txn, tbl=tbl, keys=keys):
@@ -656,8 +547,8 @@ def test_read_in_transaction_ok():
     # Then
     assert len(result) == len(values)
     # Then: txn
-    assert len(txn.called_read) == 1
-    txn_calle_read = txn.called_read[0]
+    assert txn.read_count == 1
+    txn_calle_read = txn.last_read
     assert txn_calle_read.get("columns") == columns
     assert txn_calle_read.get("table") == _TEST_TABLE_ID
-    assert txn_calle_read.get("keyset").keys == list(keys)
+    assert txn_calle_read.get("keys") == keys
@@ -2,6 +2,7 @@
 # pylint: disable=missing-module-docstring,missing-class-docstring,protected-access
 # pylint: disable=attribute-defined-outside-init,invalid-name
 # type: ignore
+import collections
 import time
 import uuid
 from datetime import datetime, timedelta
@@ -14,10 +15,14 @@ from google.auth import credentials
 from py_spanner_mutex import spanner_mutex
 from py_spanner_mutex.dto import mutex
 
+_READ_TABLE_ROWS_NAME: str = spanner_mutex.spanner.read_table_rows.__name__
+_READ_IN_TRANSACTION_NAME: str = spanner_mutex.spanner.read_in_transaction.__name__
+_CONDITIONAL_UPSERT_TABLE_ROW_NAME: str = spanner_mutex.spanner.conditional_upsert_table_row.__name__
+_SPANNER_TABLE_NAME: str = spanner_mutex.spanner.spanner_table.__name__
+_SPANNER_DB_NAME: str = spanner_mutex.spanner.spanner_db.__name__
+_DATETIME_UTCNOW_NAME: str = spanner_mutex.datetime_helper._datetime_utcnow.__name__
+
 _DATETIME_UTC_NOW: datetime = datetime.utcnow().replace(tzinfo=pytz.UTC)
-# pinning 'NOW'
-spanner_mutex.datetime_helper._datetime_utcnow = lambda: _DATETIME_UTC_NOW
-mutex.datetime_helper._datetime_utcnow = lambda: _DATETIME_UTC_NOW
 
 
 class MySpannerMutex(spanner_mutex.SpannerMutex):
@@ -45,18 +50,19 @@ class MySpannerMutex(spanner_mutex.SpannerMutex):
 
     def execute_critical_section(self, max_end_time: datetime) -> None:
         self.called[self.__class__.execute_critical_section.__name__].append(locals())
-        time.sleep(self.execute_critical_section_sleep_in_secs)
+        if self.execute_critical_section_sleep_in_secs:
+            time.sleep(self.execute_critical_section_sleep_in_secs)
 
 
 _TEST_CONFIG: mutex.MutexConfig = mutex.MutexConfig(
-    mutex_uuid=uuid.uuid4(),
+    mutex_uuid=uuid.UUID(int=0x1234),
     instance_id="INSTANCE_ID",
     database_id="DATABASE_ID",
     table_id="TABLE_ID",
     mutex_max_retries=mutex.MIN_MUTEX_MAX_RETRIES,
     mutex_wait_time_in_secs=mutex.MIN_MUTEX_WAIT_TIME_IN_SECONDS,
 )
-_TEST_CLIENT_UUID: uuid.UUID = uuid.uuid4()
+_TEST_CLIENT_UUID: uuid.UUID = uuid.UUID(int=0x5678)
 _TEST_CLIENT_DISPLAY_NAME: str = "CLIENT_DISPLAY_NAME"
 _TEST_MUTEX_STATE: mutex.MutexState = mutex.MutexState(
     uuid=_TEST_CONFIG.mutex_uuid,
@@ -67,20 +73,28 @@ _TEST_MUTEX_STATE: mutex.MutexState = mutex.MutexState(
     update_client_display_name=_TEST_CLIENT_DISPLAY_NAME,
 )
 
+_TEST_MUTEX_STATE_KW: Dict[str, Any] = _TEST_MUTEX_STATE.as_dict()
+
+_STALE_DELTA: timedelta = timedelta(seconds=_TEST_CONFIG.mutex_staleness_in_secs + 1)
+_JITTER_DELTA: timedelta = timedelta(
+    seconds=_TEST_CONFIG.mutex_ttl_in_secs * spanner_mutex._MUTEX_TTL_JITTER_IN_PERCENT + 1
+)
+_WATERMARK_DELTA: timedelta = timedelta(
+    seconds=_TEST_CONFIG.mutex_ttl_in_secs
+    + spanner_mutex._MUTEX_TTL_JITTER_IN_PERCENT * _TEST_CONFIG.mutex_ttl_in_secs
+    + 1
+)
+
 
 def _mutex_state(*, is_stale: bool = False, breach_watermark: bool = False, breaches_jitter: bool = False, **kwargs):
-    state_kw = _TEST_MUTEX_STATE.as_dict()
+    state_kw = _TEST_MUTEX_STATE_KW.copy()
     update_time_utc = None
     if is_stale:
-        update_time_utc = _DATETIME_UTC_NOW - timedelta(seconds=_TEST_CONFIG.mutex_staleness_in_secs + 1)
+        update_time_utc = _DATETIME_UTC_NOW - _STALE_DELTA
     elif breach_watermark:
-        ttl_plus_max_jitter_in_secs = (
-            _TEST_CONFIG.mutex_ttl_in_secs + spanner_mutex._MUTEX_TTL_JITTER_IN_PERCENT * _TEST_CONFIG.mutex_ttl_in_secs
-        )
-        update_time_utc = _DATETIME_UTC_NOW - timedelta(seconds=ttl_plus_max_jitter_in_secs + 1)
+        update_time_utc = _DATETIME_UTC_NOW - _WATERMARK_DELTA
     elif breaches_jitter:
-        max_jitter_in_secs = _TEST_CONFIG.mutex_ttl_in_secs * spanner_mutex._MUTEX_TTL_JITTER_IN_PERCENT
-        update_time_utc = _DATETIME_UTC_NOW - timedelta(seconds=max_jitter_in_secs + 1)
+        update_time_utc = _DATETIME_UTC_NOW - _JITTER_DELTA
     elif "update_time_utc" not in kwargs:
         update_time_utc = _DATETIME_UTC_NOW
     if update_time_utc is not None:
@@ -91,6 +105,18 @@ def _mutex_state(*, is_stale: bool = False, breach_watermark: bool = False, brea
     return mutex.MutexState(**state_kw)
 
 
+@pytest.fixture(autouse=True)
+def pin_datetime_utcnow(monkeypatch) -> None:
+    # pinning 'NOW', same module object as mutex.datetime_helper
+    monkeypatch.setattr(spanner_mutex.datetime_helper, _DATETIME_UTCNOW_NAME, lambda: _DATETIME_UTC_NOW)
+
+
+@pytest.fixture(autouse=True)
+def clear_spanner_db_cache() -> None:
+    # _spanner_db is memoized at module level, do not let a cached database leak between tests
+    spanner_mutex._spanner_db.cache_clear()
+
+
 class TestSpannerMutex:
     def setup_method(self):
         self.obj = MySpannerMutex(
@@ -150,7 +176,7 @@ class TestSpannerMutex:
         result = self.obj.status
         # Then
         assert result == cur_state.status
-        assert len(spanner_called.get(spanner_mutex.spanner.read_table_rows.__name__)) == 1
+        assert len(spanner_called.get(_READ_TABLE_ROWS_NAME)) == 1
 
     def test__is_state_stale_ok_state_is_none_true(self):
         # Given
@@ -158,24 +184,24 @@ class TestSpannerMutex:
         # When/Then
         assert self.obj._is_state_stale(state)
 
-    def test__is_state_stale_ok_state_is_old_true(self):
+    @pytest.mark.parametrize("status", list(mutex.MutexStatus))
+    def test__is_state_stale_ok_state_is_old_true(self, status: mutex.MutexStatus):
         # Given
-        for status in mutex.MutexStatus:
-            state = _mutex_state(is_stale=True, status=status)
-            # When/Then
-            assert self.obj._is_state_stale(state)
+        state = _mutex_state(is_stale=True, status=status)
+        # When/Then
+        assert self.obj._is_state_stale(state)
 
-    def test__is_state_stale_ok_state_is_current_false(self):
+    @pytest.mark.parametrize("status", list(mutex.MutexStatus))
+    def test__is_state_stale_ok_state_is_current_false(self, status: mutex.MutexStatus):
         # Given
-        for status in mutex.MutexStatus:
-            state = _mutex_state(status=status)
-            # When/Then
-            assert not self.obj._is_state_stale(state)
+        state = _mutex_state(status=status)
+        # When/Then
+        assert not self.obj._is_state_stale(state)
 
-    def test__is_critical_section_status_or_started_ok_none(self):
+    @pytest.mark.parametrize("status", list(mutex.MutexStatus))
+    def test__is_critical_section_status_or_started_ok_none(self, status: mutex.MutexStatus):
         # Given/When/Then
-        for status in mutex.MutexStatus:
-            assert not self.obj._is_critical_section_status(None, status)
+        assert not self.obj._is_critical_section_status(None, status)
 
     def test__is_critical_section_status_or_started_ok_different(self):
         # Given
@@ -183,12 +209,12 @@ class TestSpannerMutex:
         # When/Then
         assert not self.obj._is_critical_section_status(_mutex_state(status=mutex.MutexStatus.UNKNOWN), status)
 
-    def test__is_critical_section_status_or_started_ok_all_states(self):
+    @pytest.mark.parametrize("status", list(mutex.MutexStatus))
+    def test__is_critical_section_status_or_started_ok_all_states(self, status: mutex.MutexStatus):
         # Given
-        for status in mutex.MutexStatus:
-            state = _mutex_state(status=status)
-            # When/Then
-            assert self.obj._is_critical_section_status(state, status)
+        state = _mutex_state(status=status)
+        # When/Then
+        assert self.obj._is_critical_section_status(state, status)
 
     def test__is_watermark_breached_ok_state_none_breaches(self):
         # Given/When/Then
@@ -336,26 +362,23 @@ class TestSpannerMutex:
         # Then
         assert result == expected
         # Then: behavior
-        assert len(spanner_called.get(spanner_mutex.spanner.read_in_transaction.__name__)) == 1
-        assert len(spanner_called.get(spanner_mutex.spanner.conditional_upsert_table_row.__name__)) == 1
+        assert len(spanner_called.get(_READ_IN_TRANSACTION_NAME)) == 1
+        assert len(spanner_called.get(_CONDITIONAL_UPSERT_TABLE_ROW_NAME)) == 1
 
-    def test_status_ok_no_state_on_spanner(self, monkeypatch):
-        # Given
-        spanner_called = _mock_spanner_module(monkeypatch)
-        # When
+    def test_status_ok_no_state_on_spanner(self, spanner_mocks):
+        # Given/When
         result = self.obj.status
         # Then
         assert result == mutex.MutexStatus.UNKNOWN
-        assert len(spanner_called.get(spanner_mutex.spanner.read_table_rows.__name__)) == 1
+        assert len(spanner_mocks.get(_READ_TABLE_ROWS_NAME)) == 1
 
-    def test_start_ok_does_not_need_mutex(self, monkeypatch):
+    def test_start_ok_does_not_need_mutex(self, spanner_mocks):
         # Given
         self.obj.is_mutex_needed_value = False
-        spanner_called = _mock_spanner_module(monkeypatch)
         # When
         self.obj.start()
         # Then
-        _validate_start_calls(spanner_called, self.obj)
+        _validate_start_calls(spanner_mocks, self.obj)
 
     @pytest.mark.parametrize(
         "kwargs_mock",
@@ -449,28 +472,20 @@ def _mock_spanner_module(
     spanner_db: Optional[Any] = None,
     can_upsert_args: Optional[Any] = None,
 ) -> Dict[str, List[Any]]:
-    result = {}
+    result = collections.defaultdict(list)
     read_table_rows = read_table_rows if read_table_rows else []
     read_in_transaction = read_in_transaction if read_in_transaction else read_table_rows
 
-    def _add_to_result(key: str, value: Any) -> None:
-        nonlocal result
-        where = result.get(key)
-        if where is None:
-            where = []
-            result[key] = where
-        where.append(value)
-
     def mocked_read_table_rows(*args, **kwargs) -> Any:
-        _add_to_result(spanner_mutex.spanner.read_table_rows.__name__, locals())
+        result[_READ_TABLE_ROWS_NAME].append({"kwargs": kwargs})
         return iter(read_table_rows)
 
     def mocked_read_in_transaction(*args, **kwargs) -> Any:
-        _add_to_result(spanner_mutex.spanner.read_in_transaction.__name__, locals())
+        result[_READ_IN_TRANSACTION_NAME].append({"kwargs": kwargs})
         return iter(read_in_transaction)
 
     def mocked_conditional_upsert_table_row(*args, **kwargs) -> Any:
-        _add_to_result(spanner_mutex.spanner.conditional_upsert_table_row.__name__, locals())
+        result[_CONDITIONAL_UPSERT_TABLE_ROW_NAME].append({"kwargs": kwargs})
         res = conditional_upsert_table_row
         if "can_upsert" in kwargs:
             nonlocal can_upsert_args
@@ -479,38 +494,36 @@ def _mock_spanner_module(
         return res
 
     def mocked_spanner_table(*args, **kwargs) -> Any:
-        _add_to_result(spanner_mutex.spanner.spanner_table.__name__, locals())
+        result[_SPANNER_TABLE_NAME].append({"kwargs": kwargs})
         return spanner_table
 
     def mocked_spanner_db(*args, **kwargs) -> Any:
-        _add_to_result(spanner_mutex.spanner.spanner_db.__name__, locals())
+        result[_SPANNER_DB_NAME].append({"kwargs": kwargs})
         return spanner_db
 
-    monkeypatch.setattr(spanner_mutex.spanner, spanner_mutex.spanner.read_table_rows.__name__, mocked_read_table_rows)
-    monkeypatch.setattr(
-        spanner_mutex.spanner, spanner_mutex.spanner.read_in_transaction.__name__, mocked_read_in_transaction
-    )
-    monkeypatch.setattr(
-        spanner_mutex.spanner,
-        spanner_mutex.spanner.conditional_upsert_table_row.__name__,
-        mocked_conditional_upsert_table_row,
-    )
-    monkeypatch.setattr(spanner_mutex.spanner, spanner_mutex.spanner.spanner_table.__name__, mocked_spanner_table)
-    monkeypatch.setattr(spanner_mutex.spanner, spanner_mutex.spanner.spanner_db.__name__, mocked_spanner_db)
+    monkeypatch.setattr(spanner_mutex.spanner, _READ_TABLE_ROWS_NAME, mocked_read_table_rows)
+    monkeypatch.setattr(spanner_mutex.spanner, _READ_IN_TRANSACTION_NAME, mocked_read_in_transaction)
+    monkeypatch.setattr(spanner_mutex.spanner, _CONDITIONAL_UPSERT_TABLE_ROW_NAME, mocked_conditional_upsert_table_row)
+    monkeypatch.setattr(spanner_mutex.spanner, _SPANNER_TABLE_NAME, mocked_spanner_table)
+    monkeypatch.setattr(spanner_mutex.spanner, _SPANNER_DB_NAME, mocked_spanner_db)
 
     return result
 
 
+@pytest.fixture
+def spanner_mocks(monkeypatch) -> Dict[str, List[Any]]:
+    return _mock_spanner_module(monkeypatch)
+
+
 def _validate_start_calls(spanner_called: Dict[str, List[Any]], obj: MySpannerMutex, executes: bool = True) -> None:
     # Then: is_mutex_needed
     is_mutex_needed = obj.called.get(obj.__class__.is_mutex_needed.__name__)
     assert len(is_mutex_needed) == 1
     # Then: spanner_called: spanner_db
-    called_spanner_db = spanner_called.get(spanner_mutex.spanner.spanner_db.__name__)
-    # cache tools is tricky
-    assert called_spanner_db is None or len(called_spanner_db) == 1
+    called_spanner_db = spanner_called.get(_SPANNER_DB_NAME)
+    assert len(called_spanner_db) == 1
     # Then: spanner_called: spanner_table
-    called_spanner_table = spanner_called.get(spanner_mutex.spanner.spanner_table.__name__)
+    called_spanner_table = spanner_called.get(_SPANNER_TABLE_NAME)
     assert len(called_spanner_table) == 1
     # Then: execute_critical_section
     execute_critical_section = obj.called.get(obj.__class__.execute_critical_section.__name__)
@@ -519,7 +532,7 @@ def _validate_start_calls(spanner_called: Dict[str, List[Any]], obj: MySpannerMu
     else:
         assert len(execute_critical_section) == 1
         # Then: spanner_called: read_table_rows
-        called_read_table_rows = spanner_called.get(spanner_mutex.spanner.read_table_rows.__name__)
+        called_read_table_rows = spanner_called.get(_READ_TABLE_ROWS_NAME)
         assert len(called_read_table_rows) == 1
         kwargs_read_table_rows = called_read_table_rows[0].get("kwargs", {})
         assert kwargs_read_table_rows.get("table_id") == obj.config.table_id
@@ -527,9 +540,7 @@ def _validate_start_calls(spanner_called: Dict[str, List[Any]], obj: MySpannerMu
         assert len(kwargs_keys_read_table_rows) == 1
         assert kwargs_keys_read_table_rows[0][0] == str(obj.config.mutex_uuid)
         # Then: spanner_called: conditional_upsert_table_row
-        called_conditional_upsert_table_row = spanner_called.get(
-            spanner_mutex.spanner.conditional_upsert_table_row.__name__
-        )
+        called_conditional_upsert_table_row = spanner_called.get(_CONDITIONAL_UPSERT_TABLE_ROW_NAME)
         assert len(called_conditional_upsert_table_row) == 2  # one to set and one to release the mutex
         for el in called_conditional_upsert_table_row:
             kwargs = el.get("kwargs", {})
@@ -539,7 +550,7 @@ def _validate_start_calls(spanner_called: Dict[str, List[Any]], obj: MySpannerMu
             assert kwargs_row.get("update_client_uuid") == str(obj.client_uuid)
             assert kwargs_row.get("update_client_display_name") == obj.client_display_name
         # Then: spanner_called: read_in_transaction
-        called_read_in_transaction = spanner_called.get(spanner_mutex.spanner.read_in_transaction.__name__)
+        called_read_in_transaction = spanner_called.get(_READ_IN_TRANSACTION_NAME)
         assert len(called_read_in_transaction) == 2  # one to set and one to release the mutex
         for el in called_read_in_transaction:
             kwargs_keys = el.get("kwargs", {}).get("keys")